@@ -10,7 +10,7 @@ for (changed_paths, rev, revprops, has_children) in conn.iter_log(paths=None,
     print "=" * 79
     print "%d:" % rev
     print "Revision properties:"
-    for entry in revprops.items(): 
+    for entry in revprops.iteritems():
         print "  %s: %s" % entry
     print ""
 
@@ -16,7 +16,7 @@ def log_printer(changed_paths, rev, revprops, has_children=None):
     print "=" * 79
     print "%d:" % rev
     print "Revision properties:"
-    for entry in revprops.items(): 
+    for entry in revprops.iteritems():
         print "  %s: %s" % entry
     print ""
     
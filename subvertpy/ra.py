@@ -21,7 +21,6 @@ from subvertpy import SubversionException, ERR_BAD_URL
 
 from subvertpy import _ra
 from subvertpy._ra import *
-from subvertpy import ra_svn
 
 import urllib
 
@@ -198,6 +198,55 @@ class TestCommitEditor(TestDirEditor):
         self.editor.close()
 
 
+def create_repository(abspath, allow_revprop_changes=True):
+    """Create a repository.
+
+    :param abspath: Absolute path at which to create the repository
+    :param allow_revprop_changes: Whether to install a pre-revprop-change
+        hook that allows changing revision properties
+    :return: URL of the repository.
+    """
+    repos.create(abspath)
+
+    if allow_revprop_changes:
+        if sys.platform == 'win32':
+            revprop_hook = os.path.join(abspath, "hooks",
+                    "pre-revprop-change.bat")
+            f = open(revprop_hook, 'w')
+            try:
+                f.write("exit 0\n")
+            finally:
+                f.close()
+        else:
+            revprop_hook = os.path.join(abspath, "hooks",
+                    "pre-revprop-change")
+            f = open(revprop_hook, 'w')
+            try:
+                f.write("#!/bin/sh\n")
+            finally:
+                f.close()
+            os.chmod(revprop_hook, os.stat(revprop_hook).st_mode | 0111)
+
+    if sys.platform == 'win32':
+        return 'file:%s' % urllib.pathname2url(abspath)
+    else:
+        return "file://%s" % abspath
+
+
+def get_commit_editor(url, message="Test commit"):
+    """Obtain a commit editor.
+
+    :param url: URL to connect to
+    :param message: Commit message
+    :return: Commit editor object
+    """
+    ra_ctx = RemoteAccess(url.encode("utf-8"),
+        auth=Auth([ra.get_username_provider()]))
+    revnum = ra_ctx.get_latest_revnum()
+    return TestCommitEditor(ra_ctx.get_commit_editor({"svn:log": message}),
+        ra_ctx.url, revnum)
+
+
 class SubversionTestCase(TestCaseInTempDir):
     """A test case that provides the ability to build Subversion
     repositories."""
@@ -228,33 +277,8 @@ class SubversionTestCase(TestCaseInTempDir):
 
         :return: Handle to the repository.
         """
-        abspath = os.path.join(self.test_dir, relpath)
-
-        repos.create(abspath)
-
-        if allow_revprop_changes:
-            if sys.platform == 'win32':
-                revprop_hook = os.path.join(abspath, "hooks",
-                        "pre-revprop-change.bat")
-                f = open(revprop_hook, 'w')
-                try:
-                    f.write("exit 0\n")
-                finally:
-                    f.close()
-            else:
-                revprop_hook = os.path.join(abspath, "hooks",
-                        "pre-revprop-change")
-                f = open(revprop_hook, 'w')
-                try:
-                    f.write("#!/bin/sh\n")
-                finally:
-                    f.close()
-                os.chmod(revprop_hook, os.stat(revprop_hook).st_mode | 0111)
-
-        if sys.platform == 'win32':
-            return 'file:%s' % urllib.pathname2url(abspath)
-        else:
-            return "file://%s" % abspath
+        return create_repository(os.path.join(self.test_dir, relpath),
+            allow_revprop_changes=allow_revprop_changes)
 
 
     def make_checkout(self, repos_url, relpath):
@@ -423,11 +447,7 @@ class SubversionTestCase(TestCaseInTempDir):
         :param message: Commit message
         :return: Commit editor object
         """
-        ra_ctx = RemoteAccess(url.encode("utf-8"),
-            auth=Auth([ra.get_username_provider()]))
-        revnum = ra_ctx.get_latest_revnum()
-        return TestCommitEditor(ra_ctx.get_commit_editor({"svn:log": message}),
-            ra_ctx.url, revnum)
+        return get_commit_editor(url, message)
 
 
 def test_suite():
@@ -15,7 +15,10 @@
 
 """Subversion ra library tests."""
 
+import atexit
 from cStringIO import StringIO
+import os
+import tempfile
 
 from subvertpy import (
     NODE_DIR, NODE_NONE, NODE_UNKNOWN,
@@ -25,8 +28,35 @@ from subvertpy import (
 from subvertpy.tests import (
     SubversionTestCase,
     TestCase,
+    create_repository,
+    get_commit_editor,
+    rmtree_with_readonly,
     )
 
+class MyFileEditor:
+    def change_prop(self, name, val): pass
+    def close(self, checksum=None): pass
+
+
+class MyDirEditor:
+    def change_prop(self, name, val): pass
+    def add_directory(self, *args): return _dir_editor
+    def add_file(self, *args): return _file_editor
+    def close(self): pass
+
+
+class MyEditor:
+    def set_target_revision(self, rev): pass
+    def open_root(self, base_rev): return _dir_editor
+    def close(self): pass
+
+
+# The editors above are stateless, so a single instance of each is shared
+# between all nodes rather than allocating one per callback.
+_file_editor = MyFileEditor()
+_dir_editor = MyDirEditor()
+
+
 class VersionTest(TestCase):
 
     def test_version_length(self):
@@ -45,35 +75,52 @@ class TestRemoteAccessUnknown(TestCase):
         self.assertRaises(SubversionException, ra.RemoteAccess, "bla://")
 
 
-class TestRemoteAccess(SubversionTestCase):
+_readonly_repos_url = None
+
+
+def get_readonly_repository():
+    """Return the URL of a repository shared by read-only tests.
+
+    The repository is created on first use and contains a single commit
+    adding the directory "foo". It is removed when the interpreter exits.
+    """
+    global _readonly_repos_url
+    if _readonly_repos_url is None:
+        test_dir = tempfile.mkdtemp()
+        try:
+            repos_url = create_repository(os.path.join(test_dir, "d"))
+            dc = get_commit_editor(repos_url)
+            dc.add_dir("foo")
+            dc.close()
+        except:
+            rmtree_with_readonly(test_dir)
+            raise
+        atexit.register(rmtree_with_readonly, test_dir)
+        _readonly_repos_url = repos_url
+    return _readonly_repos_url
+
+
+class TestRemoteAccessReadOnly(TestCase):
+    """RemoteAccess tests that share a single repository.
+
+    See get_readonly_repository(); tests must not modify the repository.
+    """
 
     def setUp(self):
-        super(TestRemoteAccess, self).setUp()
-        self.repos_url = self.make_repository("d")
+        super(TestRemoteAccessReadOnly, self).setUp()
+        self.repos_url = get_readonly_repository()
         self.ra = ra.RemoteAccess(self.repos_url,
                 auth=ra.Auth([ra.get_username_provider()]))
 
     def tearDown(self):
         del self.ra
-        super(TestRemoteAccess, self).tearDown()
-
-    def commit_editor(self):
-        return self.get_commit_editor(self.repos_url)
-
-    def do_commit(self):
-        dc = self.get_commit_editor(self.repos_url)
-        dc.add_dir("foo")
-        dc.close()
+        super(TestRemoteAccessReadOnly, self).tearDown()
 
     def test_repr(self):
         self.assertEqual("RemoteAccess(\"%s\")" % self.repos_url,
                           repr(self.ra))
 
-    def test_latest_revnum(self):
-        self.assertEqual(0, self.ra.get_latest_revnum())
-
     def test_latest_revnum_one(self):
-        self.do_commit()
         self.assertEqual(1, self.ra.get_latest_revnum())
 
     def test_get_uuid(self):
@@ -106,37 +153,58 @@ class TestRemoteAccess(SubversionTestCase):
         self.assertIsInstance(ret, tuple)
 
     def test_get_dir_kind(self):
-        self.do_commit()
         (dirents, fetch_rev, props) = self.ra.get_dir("/", 1, fields=ra.DIRENT_KIND)
         self.assertIsInstance(props, dict)
         self.assertEqual(1, fetch_rev)
         self.assertEqual(NODE_DIR, dirents["foo"]["kind"])
 
+    def test_rev_proplist(self):
+        self.assertIsInstance(self.ra.rev_proplist(0), dict)
+
+    def test_get_locations_root(self):
+        self.assertEqual({0: "/"}, self.ra.get_locations("", 0, [0]))
+
+    def test_check_path_with_unsafe_path(self):
+        # The SVN code asserts that paths do not have a leading '/'... And if
+        # that assertion fires, it calls exit(1). That sucks. Make sure it
+        # doesn't happen.
+        self.assertRaises(ValueError, self.ra.check_path, "/bar", 1)
+        self.assertRaises(ValueError, self.ra.check_path, "///bar", 1)
+
+    def test_get_locations_dir_with_unsafe_path(self):
+        # Make sure that an invalid path won't trip an assertion error
+        self.assertRaises(ValueError, self.ra.get_locations, "//bla", 2, [1,2])
+
+
+class TestRemoteAccess(SubversionTestCase):
+
+    def setUp(self):
+        super(TestRemoteAccess, self).setUp()
+        self.repos_url = self.make_repository("d")
+        self.ra = ra.RemoteAccess(self.repos_url,
+                auth=ra.Auth([ra.get_username_provider()]))
+
+    def tearDown(self):
+        del self.ra
+        super(TestRemoteAccess, self).tearDown()
+
+    def commit_editor(self):
+        return self.get_commit_editor(self.repos_url)
+
+    def do_commit(self):
+        dc = self.get_commit_editor(self.repos_url)
+        dc.add_dir("foo")
+        dc.close()
+
+    def test_latest_revnum(self):
+        self.assertEqual(0, self.ra.get_latest_revnum())
+
     def test_change_rev_prop(self):
         self.do_commit()
         self.ra.change_rev_prop(1, "foo", "bar")
 
-    def test_rev_proplist(self):
-        self.assertIsInstance(self.ra.rev_proplist(0), dict)
-
     def test_do_diff(self):
         self.do_commit()
-
-        class MyFileEditor:
-            def change_prop(self, name, val): pass 
-            def close(self, checksum=None): pass
-
-        class MyDirEditor:
-            def change_prop(self, name, val): pass 
-            def add_directory(self, *args): return MyDirEditor()
-            def add_file(self, *args): return MyFileEditor()
-            def close(self): pass
-
-        class MyEditor:
-            def set_target_revision(self, rev): pass 
-            def open_root(self, base_rev):
-                return MyDirEditor()
-            def close(self): pass
         reporter = self.ra.do_diff(1, "", self.ra.get_repos_root(), MyEditor())
         reporter.set_path("", 0, True)
         reporter.finish()
@@ -336,9 +404,6 @@ class TestRemoteAccess(SubversionTestCase):
         stream.seek(0)
         self.assertEqual("a", stream.read())
 
-    def test_get_locations_root(self):
-        self.assertEqual({0: "/"}, self.ra.get_locations("", 0, [0]))
-
     def test_check_path(self):
         cb = self.commit_editor()
         cb.add_dir("bar")
@@ -348,13 +413,6 @@ class TestRemoteAccess(SubversionTestCase):
         self.assertEqual(NODE_DIR, self.ra.check_path("bar/", 1))
         self.assertEqual(NODE_NONE, self.ra.check_path("blaaaa", 1))
 
-    def test_check_path_with_unsafe_path(self):
-        # The SVN code asserts that paths do not have a leading '/'... And if
-        # that assertion fires, it calls exit(1). That sucks. Make sure it
-        # doesn't happen.
-        self.assertRaises(ValueError, self.ra.check_path, "/bar", 1)
-        self.assertRaises(ValueError, self.ra.check_path, "///bar", 1)
-
     def test_stat(self):
         cb = self.commit_editor()
         cb.add_dir("bar")
@@ -388,10 +446,6 @@ class TestRemoteAccess(SubversionTestCase):
         self.assertEqual({1: "/bar", 2: "/bla", 3: "/bla"}, 
                           self.ra.get_locations("bla", 3, [1,2,3]))
 
-    def test_get_locations_dir_with_unsafe_path(self):
-        # Make sure that an invalid path won't trip an assertion error
-        self.assertRaises(ValueError, self.ra.get_locations, "//bla", 2, [1,2])
-
 
 class AuthTests(TestCase):
 